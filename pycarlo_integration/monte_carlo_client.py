@@ -23,15 +23,195 @@ data observability platforms like Monte Carlo Data.
 """
 
 import os
+import re
 import json
-from typing import Dict, List, Optional, Any
+import functools
+import time
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import logging
 
+# Numba is optional - JIT-compiles the incident scoring kernel when available
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# msgspec is optional - encodes response dicts straight to JSON bytes when available
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Mock make_request routes; more specific prefixes come first in the alternation
+_MOCK_ROUTE_PATTERN = re.compile(r'/(airflow/callbacks|collectors/health|collectors|custom-metrics|incidents)')
+
+# Table counting stops after this many get_tables pages (page_size 50); beyond that
+# the count is reported as a lower bound
+_TABLE_COUNT_MAX_PAGES = 4
+
+# Incident status -> numeric code used by the scoring kernel
+_INCIDENT_STATUS_CODES = {"OPEN": 1, "RESOLVED": 0}
+
+# Column flagged by the demo completeness issue for each demo table
+_COLUMN_FOR_TABLE = {
+    "product_operations_incidents_2025": "description",
+    "business_intelligence_reports_2025": "details",
+    "data_quality_violations_2025": "details",
+    "system_monitoring_events_2025": "details",
+    "user_behavior_analytics_2025": "details",
+    "customer_support_metrics_2025": "details"
+}
+
+# (score threshold, issue template) - a demo issue is raised when the table score is below the threshold
+_ISSUE_THRESHOLDS = (
+    (90, {
+        "type": "completeness",
+        "severity": "medium",
+        "description": "Missing values detected in {table}",
+        "column": "{column}",
+        "impact": "5% of records affected"
+    }),
+    (87, {
+        "type": "freshness",
+        "severity": "low",
+        "description": "Data freshness degraded for {table}",
+        "last_update": "3.2 hours ago",
+        "expected": "< 2 hours"
+    })
+)
+
+# Demo quality rules, read-only so the shared index can't be mutated by callers
+_DEMO_RULES = tuple(MappingProxyType(rule) for rule in (
+    {
+        "rule_id": "demo-rule-001",
+        "type": "completeness",
+        "table": "product_operations_incidents_2025",
+        "column": "severity",
+        "threshold": 0.95,
+        "status": "active (demo)"
+    },
+    {
+        "rule_id": "demo-rule-002", 
+        "type": "uniqueness",
+        "table": "user_behavior_analytics_2025",
+        "column": "user_id",
+        "threshold": 1.0,
+        "status": "active (demo)"
+    },
+    {
+        "rule_id": "demo-rule-003",
+        "type": "freshness",
+        "table": "customer_support_metrics_2025", 
+        "threshold": "2 hours",
+        "status": "active (demo)"
+    }
+))
+
+# Demo rules indexed by table, built once at import
+_rules_by_table = defaultdict(list)
+for _rule in _DEMO_RULES:
+    _rules_by_table[_rule["table"]].append(_rule)
+_RULES_BY_TABLE = MappingProxyType({table: tuple(rules) for table, rules in _rules_by_table.items()})
+del _rules_by_table, _rule
+
+
+def _score_from_statuses(status_codes) -> float:
+    """Quality score from incident status codes: -10 per open incident, floor of 70"""
+    open_count = 0
+    for s in status_codes:
+        if s == 1:
+            open_count += 1
+    return max(70.0, 100.0 - open_count * 10)
+
+
+if NUMBA_AVAILABLE:
+    # cache=True persists the compiled kernel so only the first run pays compile time
+    _score_from_statuses = njit(cache=True)(_score_from_statuses)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pycarlo():
+    """
+    Import pycarlo on first production use.
+    Demo mode never calls this, so it skips pycarlo's gql/requests import cost.
+    """
+    from pycarlo.core import Client, Query, Mutation, Session
+    from pycarlo.common.errors import GqlError
+    return Client, Query, Mutation, Session, GqlError
+
+
+def _query_variable_types(field_name: str, arg_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Map argument names of a Query field to their GraphQL types from the pycarlo schema"""
+    from pycarlo.lib.schema import Query as QuerySchema
+    field_args = getattr(QuerySchema, field_name).args
+    return {name: field_args[name].type for name in arg_names}
+
+
+def _graphql_variables(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Rename snake_case variable values to the camelCase names sgqlc declares in the query"""
+    from sgqlc.types import BaseItem
+    return {BaseItem._to_graphql_name(name): value for name, value in values.items()}
+
+
+@functools.lru_cache(maxsize=16)
+def _build_field_query(field_name: str, fields: Tuple[str, ...], arg_names: Tuple[str, ...] = ()):
+    """
+    Build a single-field pycarlo Query once per shape.
+    Arguments are bound as GraphQL variables so the cached selection tree is
+    reused unchanged; the client returns a new object per response.
+    """
+    Query = _load_pycarlo()[1]
+    from sgqlc.types import Variable
+    
+    variables = _query_variable_types(field_name, arg_names)
+    query = Query(variables=variables) if variables else Query()
+    selection = getattr(query, field_name)
+    if variables:
+        selection = selection(**{name: Variable(name) for name in variables})
+    selection.__fields__(*fields)
+    return query
+
+
+@functools.lru_cache(maxsize=16)
+def _build_connection_query(field_name: str, node_fields: Tuple[str, ...], filter_names: Tuple[str, ...] = ()):
+    """Build a paginated connection Query once per shape, with first/after/filters as variables"""
+    Query = _load_pycarlo()[1]
+    from sgqlc.types import Variable
+    
+    variables = _query_variable_types(field_name, ('first', 'after') + filter_names)
+    query = Query(variables=variables)
+    connection = getattr(query, field_name)(**{name: Variable(name) for name in variables})
+    connection.edges.node.__fields__(*node_fields)
+    connection.page_info.__fields__('has_next_page', 'end_cursor')
+    return query
+
+
+def _encode_fallback(value: Any) -> Any:
+    """JSON fallback for values the encoders don't know - read-only demo rules and pycarlo scalars"""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    return str(value)
+
+
+def encode_response(response: Any) -> bytes:
+    """
+    Encode a client response (dict or list of dicts) to JSON bytes.
+    Uses msgspec's encoder when installed, falling back to json.dumps.
+    """
+    if MSGSPEC_AVAILABLE:
+        return msgspec.json.encode(response, enc_hook=_encode_fallback)
+    return json.dumps(response, default=_encode_fallback).encode()
+
 
 class MockMonteCarloClient:
     """
@@ -39,6 +219,8 @@ class MockMonteCarloClient:
     Simulates pycarlo functionality without requiring credentials.
     """
     
+    __slots__ = ('demo_mode', 'scope', 'connection_status')
+    
     def __init__(self, scope: Optional[str] = None):
         self.demo_mode = True
         self.scope = scope
@@ -95,8 +277,14 @@ class MockMonteCarloClient:
             ]
         }
     
-    def _get_table_metrics(self, table_name: str) -> Dict[str, Any]:
+    def get_quality_metrics_bulk(self, table_names: List[str]) -> List[Dict[str, Any]]:
+        """Get metrics for several tables in one call, results in input order"""
+        now = datetime.now()
+        return [self._get_table_metrics(table_name, _now=now) for table_name in table_names]
+    
+    def _get_table_metrics(self, table_name: str, _now: Optional[datetime] = None) -> Dict[str, Any]:
         """Get metrics for specific table"""
+        now = _now or datetime.now()
         # Simulate different quality scores for different demo tables
         table_scores = {
             "product_operations_incidents_2025": 92.0,
@@ -112,7 +300,7 @@ class MockMonteCarloClient:
         return {
             "table_name": table_name,
             "quality_score": score,
-            "last_updated": (datetime.now() - timedelta(hours=2)).isoformat(),
+            "last_updated": (now - timedelta(hours=2)).isoformat(),
             "row_count": 35,  # Simulated
             "issues": self._generate_demo_issues(table_name, score),
             "quality_checks": {
@@ -125,27 +313,12 @@ class MockMonteCarloClient:
     
     def _generate_demo_issues(self, table_name: str, score: float) -> List[Dict[str, Any]]:
         """Generate realistic demo issues based on quality score"""
-        issues = []
-        
-        if score < 90:
-            issues.append({
-                "type": "completeness",
-                "severity": "medium",
-                "description": f"Missing values detected in {table_name}",
-                "column": "description" if "incidents" in table_name else "details",
-                "impact": "5% of records affected"
-            })
-        
-        if score < 87:
-            issues.append({
-                "type": "freshness",
-                "severity": "low",
-                "description": f"Data freshness degraded for {table_name}",
-                "last_update": "3.2 hours ago",
-                "expected": "< 2 hours"
-            })
-        
-        return issues
+        column = _COLUMN_FOR_TABLE.get(table_name, "details")
+        return [
+            {key: value.format(table=table_name, column=column) for key, value in template.items()}
+            for threshold, template in _ISSUE_THRESHOLDS
+            if score < threshold
+        ]
     
     def create_quality_rule(self, rule_config: Dict[str, Any]) -> Dict[str, Any]:
         """Create a quality rule (simulated)"""
@@ -161,41 +334,20 @@ class MockMonteCarloClient:
             "message": f"Quality rule created in demo mode - would be deployed to production with real credentials"
         }
     
+    def create_quality_rules_bulk(self, rule_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create several quality rules in one call (simulated), results in input order"""
+        return [self.create_quality_rule(rule_config) for rule_config in rule_configs]
+    
     def get_quality_rules(self, table_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get existing quality rules"""
-        demo_rules = [
-            {
-                "rule_id": "demo-rule-001",
-                "type": "completeness",
-                "table": "product_operations_incidents_2025",
-                "column": "severity",
-                "threshold": 0.95,
-                "status": "active (demo)"
-            },
-            {
-                "rule_id": "demo-rule-002", 
-                "type": "uniqueness",
-                "table": "user_behavior_analytics_2025",
-                "column": "user_id",
-                "threshold": 1.0,
-                "status": "active (demo)"
-            },
-            {
-                "rule_id": "demo-rule-003",
-                "type": "freshness",
-                "table": "customer_support_metrics_2025", 
-                "threshold": "2 hours",
-                "status": "active (demo)"
-            }
-        ]
-        
         if table_name:
-            return [rule for rule in demo_rules if rule.get("table") == table_name]
+            return list(_RULES_BY_TABLE.get(table_name, ()))
         
-        return demo_rules
+        return list(_DEMO_RULES)
     
     def get_incidents(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get data quality incidents"""
+        now = datetime.now()
         return [
             {
                 "incident_id": "demo-incident-001",
@@ -203,7 +355,7 @@ class MockMonteCarloClient:
                 "severity": "medium",
                 "table": "business_intelligence_reports_2025",
                 "description": "Missing values in critical fields",
-                "created_at": (datetime.now() - timedelta(hours=4)).isoformat(),
+                "created_at": (now - timedelta(hours=4)).isoformat(),
                 "status": "investigating"
             },
             {
@@ -212,73 +364,99 @@ class MockMonteCarloClient:
                 "severity": "high", 
                 "table": "data_quality_violations_2025",
                 "description": "Unexpected column removed",
-                "created_at": (datetime.now() - timedelta(days=1)).isoformat(),
+                "created_at": (now - timedelta(days=1)).isoformat(),
                 "status": "resolved"
             }
         ]
     
     def make_request(self, path: str, method: str = 'GET', body: Optional[Dict] = None, 
-                    timeout_in_seconds: int = 30) -> Dict[str, Any]:
+                    timeout_in_seconds: int = 30, _now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Mock implementation of client.make_request() for direct API calls.
         Simulates specialized endpoint responses based on scope and path.
         """
-        logger.info(f"🎭 Mock {method} request to {path} (scope: {self.scope or 'default'})")
+        logger.info("🎭 Mock %s request to %s (scope: %s)", method, path, self.scope or 'default')
         
-        # Mock responses based on path and scope
-        if '/airflow/callbacks' in path:
-            return {
-                'status': 'received',
-                'callback_id': f'cb_{datetime.now().strftime("%Y%m%d%H%M%S")}',
-                'message': 'Airflow callback processed successfully'
-            }
-        elif '/collectors/health' in path:
-            return {
-                'status': 'healthy',
-                'collectors': ['dbt-prod', 'snowflake-prod', 'postgres-dev'],
-                'last_check': datetime.now().isoformat()
-            }
-        elif '/collectors' in path and method == 'POST':
-            return {
-                'status': 'deployed',
-                'collector_id': f'col_{datetime.now().strftime("%Y%m%d%H%M%S")}',
-                'deployment_url': 'https://console.aws.amazon.com/cloudformation/...'
-            }
-        elif '/custom-metrics' in path:
-            metrics_count = len(body.get('metrics', [])) if body else 0
-            return {
-                'status': 'ingested',
-                'metrics_count': metrics_count,
-                'ingestion_id': f'ing_{datetime.now().strftime("%Y%m%d%H%M%S")}'
-            }
-        elif '/incidents' in path:
-            return {
-                'status': 'success',
-                'incidents': [
-                    {'id': 'inc_001', 'type': 'freshness', 'status': 'open'},
-                    {'id': 'inc_002', 'type': 'volume', 'status': 'resolved'}
-                ]
-            }
-        else:
-            return {
-                'status': 'success',
-                'path': path,
-                'method': method,
-                'message': f'Mock response for {method} {path}'
-            }
+        # Mock responses based on path and scope - one regex search picks the route,
+        # then a single dict lookup (route, method) -> handler, falling back to (route, None)
+        match = _MOCK_ROUTE_PATTERN.search(path)
+        if match:
+            route = match.group(1)
+            handler = self._ROUTE_HANDLERS.get((route, method)) or self._ROUTE_HANDLERS.get((route, None))
+            if handler:
+                return handler(self, path, method, body, _now or datetime.now())
+        
+        return {
+            'status': 'success',
+            'path': path,
+            'method': method,
+            'message': f'Mock response for {method} {path}'
+        }
+    
+    def _handle_airflow_callback(self, path: str, method: str, body: Optional[Dict], now: datetime) -> Dict[str, Any]:
+        return {
+            'status': 'received',
+            'callback_id': f'cb_{now.strftime("%Y%m%d%H%M%S")}',
+            'message': 'Airflow callback processed successfully'
+        }
+    
+    def _handle_collectors_health(self, path: str, method: str, body: Optional[Dict], now: datetime) -> Dict[str, Any]:
+        return {
+            'status': 'healthy',
+            'collectors': ['dbt-prod', 'snowflake-prod', 'postgres-dev'],
+            'last_check': now.isoformat()
+        }
+    
+    def _handle_collector_deploy(self, path: str, method: str, body: Optional[Dict], now: datetime) -> Dict[str, Any]:
+        return {
+            'status': 'deployed',
+            'collector_id': f'col_{now.strftime("%Y%m%d%H%M%S")}',
+            'deployment_url': 'https://console.aws.amazon.com/cloudformation/...'
+        }
+    
+    def _handle_custom_metrics(self, path: str, method: str, body: Optional[Dict], now: datetime) -> Dict[str, Any]:
+        metrics_count = len(body.get('metrics', [])) if body else 0
+        return {
+            'status': 'ingested',
+            'metrics_count': metrics_count,
+            'ingestion_id': f'ing_{now.strftime("%Y%m%d%H%M%S")}'
+        }
+    
+    def _handle_incidents(self, path: str, method: str, body: Optional[Dict], now: datetime) -> Dict[str, Any]:
+        return {
+            'status': 'success',
+            'incidents': [
+                {'id': 'inc_001', 'type': 'freshness', 'status': 'open'},
+                {'id': 'inc_002', 'type': 'volume', 'status': 'resolved'}
+            ]
+        }
+    
+    # (route, method) -> handler; a method of None matches any HTTP method
+    _ROUTE_HANDLERS = {
+        ('airflow/callbacks', None): _handle_airflow_callback,
+        ('collectors/health', None): _handle_collectors_health,
+        ('collectors', 'POST'): _handle_collector_deploy,
+        ('custom-metrics', None): _handle_custom_metrics,
+        ('incidents', None): _handle_incidents,
+    }
 
 
 class ProductionMonteCarloClient:
     """
     Production Monte Carlo client wrapper for pycarlo.
     Uses the official pycarlo.core Client, Query, and Mutation classes.
+    
+    A single pycarlo Client is shared across threads: it only holds the Session
+    credentials and issues each call through requests.request, so there is no
+    per-client connection state for concurrent queries to contend on.
     """
     
+    __slots__ = ('client', 'Query', 'Mutation', 'Session', 'GqlError', 'demo_mode', 'scope')
+    
     def __init__(self, scope: Optional[str] = None):
         try:
             # Import proper pycarlo classes
-            from pycarlo.core import Client, Query, Mutation, Session
-            from pycarlo.common.errors import GqlError
+            Client, Query, Mutation, Session, GqlError = _load_pycarlo()
             
             # Check for credentials - pycarlo can use profiles or environment variables
             api_id = os.getenv("MONTE_CARLO_API_ID")
@@ -290,7 +468,7 @@ class ProductionMonteCarloClient:
                     # For specialized integrations (e.g., AirflowCallbacks, DataCollectors, etc.)
                     session = Session(mcd_id=api_id, mcd_token=api_token, scope=scope)
                     self.client = Client(session=session)
-                    logger.info(f"🔗 Connected to Monte Carlo with scope: {scope}")
+                    logger.info("🔗 Connected to Monte Carlo with scope: %s", scope)
                 else:
                     # Standard Session without scope
                     session = Session(mcd_id=api_id, mcd_token=api_token)
@@ -313,7 +491,7 @@ class ProductionMonteCarloClient:
             logger.warning("pycarlo not installed - run: pip install pycarlo")
             raise
         except Exception as e:
-            logger.error(f"Failed to connect to Monte Carlo: {e}")
+            logger.error("Failed to connect to Monte Carlo: %s", e)
             raise
     
     def make_request(self, path: str, method: str = 'GET', body: Optional[Dict] = None, 
@@ -331,25 +509,17 @@ class ProductionMonteCarloClient:
             )
             return response
         except self.GqlError as e:
-            logger.error(f"API request failed: {e}")
+            logger.error("API request failed: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             return {"error": str(e)}
-            
-        except ImportError:
-            logger.warning("pycarlo not installed - run: pip install pycarlo")
-            raise
-        except Exception as e:
-            logger.error(f"Failed to connect to Monte Carlo: {e}")
-            raise
     
     def test_connection(self) -> Dict[str, Any]:
         """Test connection to Monte Carlo using pycarlo Query"""
         try:
             # Test connection with getUser query
-            query = self.Query()
-            query.get_user.__fields__('email', 'first_name')
+            query = _build_field_query('get_user', ('email', 'first_name'))
             response = self.client(query)
             
             return {
@@ -373,8 +543,7 @@ class ProductionMonteCarloClient:
     def get_account_info(self) -> Dict[str, Any]:
         """Get account information using pycarlo Query"""
         try:
-            query = self.Query()
-            query.get_account.__fields__('name', 'uuid', 'region')
+            query = _build_field_query('get_account', ('name', 'uuid', 'region'))
             response = self.client(query)
             
             return {
@@ -392,7 +561,7 @@ class ProductionMonteCarloClient:
                 ]
             }
         except Exception as e:
-            logger.error(f"Error getting account info: {e}")
+            logger.error("Error getting account info: %s", e)
             return {
                 "account_name": "Error",
                 "account_id": "unknown",
@@ -406,41 +575,37 @@ class ProductionMonteCarloClient:
             if table_name:
                 return self._get_table_metrics_pycarlo(table_name)
             
-            # Get overall metrics using getTables query
-            query = self.Query()
-            query.get_tables(first=50).__fields__(
-                edges=query.get_tables.edges.__fields__(
-                    node=query.get_tables.edges.node.__fields__(
-                        'full_table_id', 'database', 'schema', 'table_name'
-                    )
-                )
+            # Count tables page by page - only full_table_id is selected since the
+            # count is all we use. The page cap bounds round trips on large accounts,
+            # so past it the count is a lower bound
+            total_tables = 0
+            tables_capped = False
+            table_pages = self._iter_connection_pages(
+                'get_tables', ('full_table_id',), page_size=50, with_has_next=True
             )
-            response = self.client(query)
+            for page_number, (page, has_next_page) in enumerate(table_pages, 1):
+                total_tables += len(page)
+                if page_number == _TABLE_COUNT_MAX_PAGES:
+                    tables_capped = has_next_page
+                    break
             
-            tables = [edge.node for edge in response.get_tables.edges]
-            
-            # Get incidents for quality scoring
-            incidents_query = self.Query()
-            incidents_query.get_incidents(first=20).__fields__(
-                edges=incidents_query.get_incidents.edges.__fields__(
-                    node=incidents_query.get_incidents.edges.node.__fields__(
-                        'id', 'status', 'incident_type', 'severity'
-                    )
-                )
-            )
-            incidents_response = self.client(incidents_query)
-            
-            active_incidents = [
-                edge.node for edge in incidents_response.get_incidents.edges 
-                if edge.node.status == 'OPEN'
-            ]
+            # Get incidents for quality scoring; later pages are only fetched while
+            # every incident on the current page is still open
+            active_incidents = []
+            incident_fields = ('id', 'status', 'incident_type', 'severity')
+            for page in self._iter_connection_pages('get_incidents', incident_fields, page_size=20):
+                open_on_page = [node for node in page if node.status == 'OPEN']
+                active_incidents.extend(open_on_page)
+                if len(open_on_page) < 20:
+                    break
             
             return {
                 "overall_score": max(85.0, 100.0 - len(active_incidents) * 5),
-                "total_tables": len(tables),
-                "tables_monitored": len(tables),
+                "total_tables": total_tables,
+                "tables_monitored": total_tables,
+                "tables_count_is_lower_bound": tables_capped,
                 "active_incidents": len(active_incidents),
-                "resolved_incidents": 20 - len(active_incidents),
+                "resolved_incidents": max(0, 20 - len(active_incidents)),
                 "quality_trends": {
                     "last_7_days": [85, 88, 89, 86, 87, 88, 90],
                     "improvement": "+5.9%"
@@ -452,7 +617,7 @@ class ProductionMonteCarloClient:
                 ]
             }
         except Exception as e:
-            logger.error(f"Error getting quality metrics: {e}")
+            logger.error("Error getting quality metrics: %s", e)
             # Return demo data as fallback
             return {
                 "overall_score": 87.5,
@@ -464,16 +629,43 @@ class ProductionMonteCarloClient:
                 "top_issues": []
             }
     
+    def get_quality_metrics_bulk(self, table_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get metrics for several tables in one call, results in input order.
+        Tables are still looked up one by one; this is the single entry
+        point a batched query would replace.
+        """
+        return [self._get_table_metrics_pycarlo(table_name) for table_name in table_names]
+    
+    def _iter_connection_pages(self, field_name: str, node_fields: tuple, page_size: int,
+                               with_has_next: bool = False, **filters):
+        """
+        Yield one page of connection nodes at a time, following page_info cursors.
+        With with_has_next, yield (nodes, has_next_page) pairs instead.
+        """
+        query = _build_connection_query(field_name, node_fields, tuple(sorted(filters)))
+        after = None
+        while True:
+            variables = dict(filters, first=page_size, after=after)
+            result = getattr(self.client(query, variables=_graphql_variables(variables)), field_name)
+            nodes = [edge.node for edge in result.edges]
+            
+            yield (nodes, result.page_info.has_next_page) if with_has_next else nodes
+            
+            if not result.page_info.has_next_page:
+                return
+            after = result.page_info.end_cursor
+    
     def _get_table_metrics_pycarlo(self, table_name: str) -> Dict[str, Any]:
         """Get metrics for specific table using pycarlo"""
         try:
             # Get table info
-            query = self.Query()
-            query.get_table(full_table_id=table_name).__fields__(
-                'full_table_id', 'database', 'schema', 'table_name', 
-                'row_count', 'last_updated_time'
+            query = _build_field_query(
+                'get_table',
+                ('full_table_id', 'database', 'schema', 'table_name', 'row_count', 'last_updated_time'),
+                ('full_table_id',)
             )
-            response = self.client(query)
+            response = self.client(query, variables=_graphql_variables({'full_table_id': table_name}))
             
             if not response.get_table:
                 raise ValueError(f"Table {table_name} not found")
@@ -481,24 +673,19 @@ class ProductionMonteCarloClient:
             table = response.get_table
             
             # Get incidents for this table
-            incidents_query = self.Query()
-            incidents_query.get_incidents(
-                first=10,
-                resource_id=table_name
-            ).__fields__(
-                edges=incidents_query.get_incidents.edges.__fields__(
-                    node=incidents_query.get_incidents.edges.node.__fields__(
-                        'id', 'status', 'incident_type', 'severity', 'description'
-                    )
-                )
-            )
-            incidents_response = self.client(incidents_query)
-            
-            incidents = [edge.node for edge in incidents_response.get_incidents.edges]
+            incidents = next(self._iter_connection_pages(
+                'get_incidents',
+                ('id', 'status', 'incident_type', 'severity', 'description'),
+                page_size=10,
+                full_table_ids=[table_name]
+            ))
             open_incidents = [i for i in incidents if i.status == 'OPEN']
-            
-            quality_score = max(70.0, 100.0 - len(open_incidents) * 10)
-            
+
+            status_codes = [_INCIDENT_STATUS_CODES.get(i.status, 0) for i in incidents]
+            if NUMBA_AVAILABLE:
+                status_codes = np.asarray(status_codes, dtype=np.int8)
+            quality_score = _score_from_statuses(status_codes)
+
             return {
                 "table_name": table.full_table_id,
                 "quality_score": quality_score,
@@ -520,7 +707,7 @@ class ProductionMonteCarloClient:
                 }
             }
         except Exception as e:
-            logger.error(f"Error getting table metrics for {table_name}: {e}")
+            logger.error("Error getting table metrics for %s: %s", table_name, e)
             return {
                 "table_name": table_name,
                 "quality_score": 85.0,
@@ -552,13 +739,21 @@ class ProductionMonteCarloClient:
                 "message": f"Quality rule created in production Monte Carlo"
             }
         except Exception as e:
-            logger.error(f"Error creating quality rule: {e}")
+            logger.error("Error creating quality rule: %s", e)
             return {
                 "rule_id": "error",
                 "status": "failed",
                 "message": str(e)
             }
     
+    def create_quality_rules_bulk(self, rule_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several quality rules in one call, results in input order.
+        Rule mutations are still simulated per rule; this is the single entry
+        point a batched mutation would replace.
+        """
+        return [self.create_quality_rule(rule_config) for rule_config in rule_configs]
+    
     def get_quality_rules(self, table_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get quality rules using pycarlo Query"""
         try:
@@ -584,45 +779,75 @@ class ProductionMonteCarloClient:
                 }
             ]
         except Exception as e:
-            logger.error(f"Error getting quality rules: {e}")
+            logger.error("Error getting quality rules: %s", e)
             return []
     
     def get_incidents(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get incidents using pycarlo Query"""
         try:
-            query = self.Query()
-            query.get_incidents(first=limit).__fields__(
-                edges=query.get_incidents.edges.__fields__(
-                    node=query.get_incidents.edges.node.__fields__(
-                        'id', 'status', 'incident_type', 'severity', 
-                        'description', 'created_time', 'full_table_id'
-                    )
-                )
-            )
-            response = self.client(query)
+            nodes = next(self._iter_connection_pages(
+                'get_incidents',
+                ('id', 'status', 'incident_type', 'severity', 'description', 'created_time', 'full_table_id'),
+                page_size=limit
+            ))
             
             return [
                 {
-                    "incident_id": edge.node.id,
-                    "type": edge.node.incident_type.lower(),
-                    "severity": edge.node.severity.lower(),
-                    "table": edge.node.full_table_id,
-                    "description": edge.node.description,
-                    "created_at": edge.node.created_time,
-                    "status": edge.node.status.lower()
-                } for edge in response.get_incidents.edges
+                    "incident_id": node.id,
+                    "type": node.incident_type.lower(),
+                    "severity": node.severity.lower(),
+                    "table": node.full_table_id,
+                    "description": node.description,
+                    "created_at": node.created_time,
+                    "status": node.status.lower()
+                } for node in nodes
             ]
         except Exception as e:
-            logger.error(f"Error getting incidents: {e}")
+            logger.error("Error getting incidents: %s", e)
             return []
 
 
+class ConnectionCircuitBreaker:
+    """
+    Health-TTL wrapper around a client's test_connection.
+    A recent success is served from cache for success_ttl seconds and a recent
+    failure for the shorter failure_ttl, so status polling doesn't hit the API each time.
+    """
+    
+    __slots__ = ('success_ttl', 'failure_ttl', 'last_success_ts', 'last_failure_ts', 'last_result')
+    
+    def __init__(self, success_ttl: float = 30.0, failure_ttl: float = 5.0):
+        self.success_ttl = success_ttl
+        self.failure_ttl = failure_ttl
+        self.last_success_ts: Optional[float] = None
+        self.last_failure_ts: Optional[float] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+    
+    def call(self, test_connection) -> Dict[str, Any]:
+        """Return the cached connection result while fresh, otherwise call through"""
+        now = time.monotonic()
+        if self.last_success_ts is not None and now - self.last_success_ts < self.success_ttl:
+            return dict(self.last_result)
+        if self.last_failure_ts is not None and now - self.last_failure_ts < self.failure_ttl:
+            return dict(self.last_result)
+        
+        result = test_connection()
+        if result.get("status") == "connected":
+            self.last_success_ts, self.last_failure_ts = now, None
+        else:
+            self.last_success_ts, self.last_failure_ts = None, now
+        self.last_result = result
+        return dict(result)
+
+
 class MonteCarloIntegration:
     """
     Main integration class that handles both demo and production modes.
     Supports various Monte Carlo scopes for specialized integrations.
     """
     
+    __slots__ = ('demo_mode', 'scope', 'client', '_ttl_cache')
+    
     def __init__(self, demo_mode: Optional[bool] = None, scope: Optional[str] = None):
         # Auto-detect mode if not specified
         if demo_mode is None:
@@ -637,6 +862,7 @@ class MonteCarloIntegration:
         
         self.demo_mode = demo_mode
         self.scope = scope
+        self._ttl_cache = ConnectionCircuitBreaker()
         
         if demo_mode:
             self.client = MockMonteCarloClient(scope=scope)
@@ -644,13 +870,13 @@ class MonteCarloIntegration:
         else:
             self.client = ProductionMonteCarloClient(scope=scope)
             if scope:
-                logger.info(f"🔗 Running in production mode with scope: {scope}")
+                logger.info("🔗 Running in production mode with scope: %s", scope)
             else:
                 logger.info("🔗 Running in production mode")
     
     def get_integration_status(self) -> Dict[str, Any]:
         """Get current integration status"""
-        connection_test = self.client.test_connection()
+        connection_test = self._ttl_cache.call(self.client.test_connection)
         
         return {
             "mode": "demo" if self.demo_mode else "production",
@@ -9,16 +9,127 @@ using Monte Carlo SDK (pycarlo) - works in both demo and production modes.
 import os
 import sys
 import json
+import argparse
+import asyncio
+import functools
 import logging
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict, deque
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import subprocess
 
-# Add the parent directory to the path to import our modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+
+# orjson is optional - faster serialization of the pipeline config when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Run as a script, only this file's directory is on the path - add the repo root
+# so the package imports below resolve. Package imports leave sys.path alone.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 logger = logging.getLogger(__name__)
 
+# Import our quality components once, at module load
+try:
+    from pycarlo_integration.monte_carlo_client import MonteCarloIntegration
+    from pycarlo_integration.quality_rules import EnterpriseQualityRules
+    _IMPORTS_OK = True
+    _IMPORT_ERROR = None
+except ImportError as e:
+    _IMPORTS_OK = False
+    _IMPORT_ERROR = e
+
+# Metrics cache bounds - entries are keyed by (dataset, commit) and expire after the TTL
+METRICS_CACHE_TTL_SECONDS = 300
+METRICS_CACHE_MAXSIZE = 512
+# Latencies kept per cache outcome for cache_stats - the most recent samples only
+METRICS_LATENCY_SAMPLES = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _current_commit_sha() -> Optional[str]:
+    """Commit being checked - from the CI environment, else the local git HEAD (resolved once per process)"""
+    sha = os.getenv("GITHUB_SHA") or os.getenv("CI_COMMIT_SHA")
+    if sha:
+        return sha
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# GitHub Actions workflow running the quality checks - static, so serialized once at import
+_PIPELINE_CONFIG = {
+    "name": "Data Quality Pipeline",
+    "on": {
+        "push": {"branches": ["main", "staging"]},
+        "pull_request": {"branches": ["main"]}
+    },
+    "jobs": {
+        "data_quality_checks": {
+            "runs-on": "ubuntu-latest",
+            "steps": [
+                {
+                    "name": "Checkout code",
+                    "uses": "actions/checkout@v3"
+                },
+                {
+                    "name": "Set up Python",
+                    "uses": "actions/setup-python@v4",
+                    "with": {"python-version": "3.12"}
+                },
+                {
+                    "name": "Install dependencies",
+                    "run": "pip install -r requirements.txt pycarlo"
+                },
+                {
+                    "name": "Run data quality checks",
+                    "run": "python pycarlo_integration/pipeline_integration.py --check-quality",
+                    "env": {
+                        "MONTE_CARLO_API_ID": "${{ secrets.MONTE_CARLO_API_ID }}",
+                        "MONTE_CARLO_API_TOKEN": "${{ secrets.MONTE_CARLO_API_TOKEN }}"
+                    }
+                }
+            ]
+        },
+        "deploy": {
+            "needs": "data_quality_checks",
+            "runs-on": "ubuntu-latest",
+            "if": "success()",
+            "steps": [
+                {
+                    "name": "Deploy application",
+                    "run": "echo 'Deploying application...'"
+                },
+                {
+                    "name": "Setup monitoring",
+                    "run": "python pycarlo_integration/pipeline_integration.py --setup-monitoring"
+                }
+            ]
+        }
+    }
+}
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Two-space indented JSON, via orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+_PIPELINE_CONFIG_JSON = _dumps_indented(_PIPELINE_CONFIG)
+
 
 class QualityGateException(Exception):
     """Exception raised when data quality checks fail pipeline gates"""
@@ -30,8 +141,10 @@ class DataQualityPipeline:
     CI/CD pipeline integration for data quality checks
     """
     
-    def __init__(self, demo_mode: bool = True):
+    def __init__(self, demo_mode: bool = True, fail_fast: bool = True, parallelism: int = 8):
         self.demo_mode = demo_mode
+        self.fail_fast = fail_fast
+        self.parallelism = parallelism  # Max datasets fetched/set up concurrently
         self.quality_thresholds = {
             "overall_score": 85.0,  # Minimum overall quality score
             "critical_rules": 100.0,  # Critical rules must pass 100%
@@ -39,17 +152,26 @@ class DataQualityPipeline:
             "medium_rules": 90.0,    # Medium severity rules threshold
         }
         
-        # Import our quality components
-        try:
-            from pycarlo_integration.monte_carlo_client import MonteCarloIntegration
-            from pycarlo_integration.quality_rules import EnterpriseQualityRules
-            
-            self.mc_integration = MonteCarloIntegration(demo_mode=demo_mode)
-            self.quality_rules = EnterpriseQualityRules(demo_mode=demo_mode)
-            
-        except ImportError as e:
-            logger.error(f"Failed to import quality components: {e}")
-            raise
+        # TTL cache for get_quality_metrics, shared by the gate worker threads
+        self._metrics_cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.Lock()
+        self._commit_sha = _current_commit_sha()
+        
+        # Cache hits/misses with their latencies, and counts of uncached client calls
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "hit_latency_ns": deque(maxlen=METRICS_LATENCY_SAMPLES),
+            "miss_latency_ns": deque(maxlen=METRICS_LATENCY_SAMPLES),
+            "api_calls": Counter()
+        }
+        
+        if not _IMPORTS_OK:
+            logger.error(f"Failed to import quality components: {_IMPORT_ERROR}")
+            raise ImportError(f"Quality components unavailable: {_IMPORT_ERROR}") from _IMPORT_ERROR
+        
+        self.mc_integration = MonteCarloIntegration(demo_mode=demo_mode)
+        self.quality_rules = EnterpriseQualityRules(demo_mode=demo_mode)
     
     def run_pre_deployment_checks(self, datasets: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -73,27 +195,159 @@ class DataQualityPipeline:
             "recommendations": []
         }
         
-        for dataset_name, config in datasets.items():
-            gate_result = self._check_quality_gate(dataset_name, config)
+        # Gates are independent and latency-bound, so they run concurrently
+        gate_results = asyncio.run(self._run_quality_gates(datasets))
+        
+        for gate_result in gate_results:
             results["quality_gates"].append(gate_result)
             
             if not gate_result["passed"]:
                 results["overall_status"] = "failed"
                 results["recommendations"].extend(gate_result.get("recommendations", []))
         
-        # Log results
+        # Log results - one write for the whole summary
         status_emoji = "✅" if results["overall_status"] == "passed" else "❌"
-        print(f"{status_emoji} Pre-deployment checks: {results['overall_status']}")
+        out = [f"{status_emoji} Pre-deployment checks: {results['overall_status']}"]
         
         if results["overall_status"] == "failed":
-            print("🚨 Quality gate failures detected!")
-            for rec in results["recommendations"]:
-                print(f"  💡 {rec}")
+            out.append("🚨 Quality gate failures detected!")
+            out.extend(f"  💡 {rec}" for rec in results["recommendations"])
         
+        sys.stdout.write("\n".join(out) + "\n")
         return results
     
-    def _check_quality_gate(self, dataset_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Check quality gate for a specific dataset"""
+    async def _run_quality_gates(self, datasets: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run every dataset's quality gate concurrently, keeping dataset order"""
+        # Incidents are the same for every dataset - fetch them once, shared by all gates
+        incidents_by_table = asyncio.ensure_future(
+            self._fetch_open_incidents_by_table(limit=max(5, len(datasets) * 5))
+        )
+        semaphore = asyncio.Semaphore(self.parallelism)
+        tasks = [self._fetch_gate_inputs(name, incidents_by_table, semaphore) for name in datasets]
+        fetched = await asyncio.gather(*tasks)
+        
+        # Compare every fetched score to its threshold in one vectorized pass
+        ok = [i for i, inputs in enumerate(fetched) if not isinstance(inputs, Exception)]
+        configs = list(datasets.values())
+        scores = np.array([fetched[i][0].get("quality_score", 0.0) for i in ok], dtype=float)
+        mins = np.array([
+            configs[i].get("min_quality_score", self.quality_thresholds["overall_score"]) for i in ok
+        ], dtype=float)
+        below_threshold = dict(zip(ok, (scores < mins).tolist()))
+        
+        gate_results = []
+        for i, (name, config) in enumerate(datasets.items()):
+            if i not in below_threshold:
+                gate_results.append(self._quality_gate_error(name, fetched[i]))
+                continue
+            metrics, dataset_incidents = fetched[i]
+            gate_results.append(self._check_quality_gate(
+                name, config, metrics, dataset_incidents, below_threshold=below_threshold[i]
+            ))
+        return gate_results
+    
+    async def _fetch_open_incidents_by_table(self, limit: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch incidents once and group the unresolved ones by table"""
+        incidents = await asyncio.to_thread(self._api_call, "get_incidents", limit=limit)
+        by_table = defaultdict(list)
+        for inc in incidents:
+            if inc.get("status") != "resolved":
+                by_table[inc.get("table")].append(inc)
+        return by_table
+    
+    async def _fetch_gate_inputs(self, dataset_name: str, incidents_by_table: "asyncio.Future",
+                                 semaphore: asyncio.Semaphore) -> Any:
+        """
+        Fetch metrics for a dataset while the shared incidents load.
+        Returns (metrics, dataset_incidents), or the exception if either fetch failed.
+        """
+        try:
+            async with semaphore:
+                metrics, by_table = await asyncio.gather(
+                    asyncio.to_thread(self._cached_metrics, dataset_name),
+                    incidents_by_table
+                )
+        except Exception as e:
+            logger.error(f"Error checking quality gate for {dataset_name}: {e}")
+            return e
+        
+        return metrics, by_table.get(dataset_name, [])
+    
+    def _cached_metrics(self, dataset_name: str) -> Dict[str, Any]:
+        """get_quality_metrics for a dataset, served from cache within the TTL for the same commit"""
+        start = time.perf_counter_ns()
+        key = (dataset_name, self._commit_sha)
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._metrics_cache.get(key)
+            if entry and entry[0] > now:
+                self._stats["hits"] += 1
+                self._stats["hit_latency_ns"].append(time.perf_counter_ns() - start)
+                return entry[1]
+        
+        metrics = self.mc_integration.client.get_quality_metrics(dataset_name)
+        
+        with self._cache_lock:
+            self._stats["misses"] += 1
+            self._stats["miss_latency_ns"].append(time.perf_counter_ns() - start)
+            self._metrics_cache.pop(key, None)
+            if len(self._metrics_cache) >= METRICS_CACHE_MAXSIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._metrics_cache.pop(next(iter(self._metrics_cache)))
+            self._metrics_cache[key] = (now + METRICS_CACHE_TTL_SECONDS, metrics)
+        return metrics
+    
+    def _api_call(self, method_name: str, *args, **kwargs) -> Any:
+        """Call an uncached Monte Carlo client method, counting it in the pipeline stats"""
+        result = getattr(self.mc_integration.client, method_name)(*args, **kwargs)
+        with self._cache_lock:
+            self._stats["api_calls"][method_name] += 1
+        return result
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Quality metrics cache effectiveness: hit rate, and speedup as the median
+        miss latency over the median hit latency, both over the most recent
+        METRICS_LATENCY_SAMPLES lookups. Also counts uncached client calls.
+        """
+        with self._cache_lock:
+            hits, misses = self._stats["hits"], self._stats["misses"]
+            hit_latency = self._stats["hit_latency_ns"]
+            miss_latency = self._stats["miss_latency_ns"]
+            speedup = None
+            if hit_latency and miss_latency:
+                speedup = statistics.median(miss_latency) / max(statistics.median(hit_latency), 1)
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "speedup": speedup,
+                "size": len(self._metrics_cache),
+                "api_calls": dict(self._stats["api_calls"])
+            }
+    
+    def _quality_gate_error(self, dataset_name: str, error: Exception) -> Dict[str, Any]:
+        """Failed gate result for a dataset whose checks could not run"""
+        return {
+            "dataset": dataset_name,
+            "passed": False,
+            "quality_score": 0.0,
+            "checks": [{
+                "check": "quality_gate_execution",
+                "status": "error",
+                "message": str(error)
+            }],
+            "recommendations": []
+        }
+    
+    def _check_quality_gate(self, dataset_name: str, config: Dict[str, Any],
+                            metrics: Dict[str, Any], dataset_incidents: List[Dict[str, Any]],
+                            below_threshold: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Check quality gate for a specific dataset against its unresolved incidents.
+        below_threshold is the precomputed score comparison, when the caller batched it.
+        With fail_fast, checks after the first failure are reported as skipped.
+        """
         gate_result = {
             "dataset": dataset_name,
             "passed": True,
@@ -103,60 +357,25 @@ class DataQualityPipeline:
         }
         
         try:
-            # Get quality metrics from Monte Carlo (demo or production)
-            metrics = self.mc_integration.client.get_quality_metrics(dataset_name)
+            # Quality metrics from Monte Carlo (demo or production)
             gate_result["quality_score"] = metrics.get("quality_score", 0.0)
             
-            # Check against thresholds
-            score = gate_result["quality_score"]
-            min_score = config.get("min_quality_score", self.quality_thresholds["overall_score"])
-            
-            if score < min_score:
-                gate_result["passed"] = False
-                gate_result["checks"].append({
-                    "check": "overall_quality_score",
-                    "status": "failed",
-                    "actual": score,
-                    "threshold": min_score,
-                    "message": f"Quality score {score:.1f}% below threshold {min_score:.1f}%"
-                })
-                gate_result["recommendations"].append(
-                    f"Improve data quality for {dataset_name} before deployment"
-                )
-            else:
-                gate_result["checks"].append({
-                    "check": "overall_quality_score", 
-                    "status": "passed",
-                    "actual": score,
-                    "threshold": min_score,
-                    "message": f"Quality score {score:.1f}% meets threshold"
-                })
-            
-            # Check for active incidents
-            incidents = self.mc_integration.client.get_incidents(limit=5)
-            dataset_incidents = [
-                inc for inc in incidents 
-                if inc.get("table") == dataset_name and inc.get("status") != "resolved"
-            ]
-            
-            if dataset_incidents:
-                gate_result["passed"] = False
-                gate_result["checks"].append({
-                    "check": "active_incidents",
-                    "status": "failed",
-                    "count": len(dataset_incidents),
-                    "message": f"{len(dataset_incidents)} active quality incidents"
-                })
-                gate_result["recommendations"].append(
-                    f"Resolve {len(dataset_incidents)} active incidents for {dataset_name}"
+            for check_name, check_fn in self._gate_checks():
+                if self.fail_fast and not gate_result["passed"]:
+                    gate_result["checks"].append({
+                        "check": check_name,
+                        "status": "skipped",
+                        "message": "Skipped after an earlier failed check"
+                    })
+                    continue
+                
+                check, recommendation = check_fn(
+                    dataset_name, config, gate_result["quality_score"], dataset_incidents, below_threshold
                 )
-            else:
-                gate_result["checks"].append({
-                    "check": "active_incidents",
-                    "status": "passed",
-                    "count": 0,
-                    "message": "No active quality incidents"
-                })
+                gate_result["checks"].append(check)
+                if check["status"] == "failed":
+                    gate_result["passed"] = False
+                    gate_result["recommendations"].append(recommendation)
             
         except Exception as e:
             logger.error(f"Error checking quality gate for {dataset_name}: {e}")
@@ -169,32 +388,95 @@ class DataQualityPipeline:
         
         return gate_result
     
+    def _gate_checks(self):
+        """(check name, check function) pairs run in order by _check_quality_gate"""
+        return (
+            ("overall_quality_score", self._check_quality_score),
+            ("active_incidents", self._check_active_incidents)
+        )
+    
+    def _check_quality_score(self, dataset_name: str, config: Dict[str, Any], score: float,
+                             dataset_incidents: List[Dict[str, Any]],
+                             below_threshold: Optional[bool] = None) -> tuple:
+        """Check the quality score against the dataset's threshold"""
+        min_score = config.get("min_quality_score", self.quality_thresholds["overall_score"])
+        if below_threshold is None:
+            below_threshold = score < min_score
+        
+        if below_threshold:
+            return {
+                "check": "overall_quality_score",
+                "status": "failed",
+                "actual": score,
+                "threshold": min_score,
+                "message": f"Quality score {score:.1f}% below threshold {min_score:.1f}%"
+            }, f"Improve data quality for {dataset_name} before deployment"
+        
+        return {
+            "check": "overall_quality_score", 
+            "status": "passed",
+            "actual": score,
+            "threshold": min_score,
+            "message": f"Quality score {score:.1f}% meets threshold"
+        }, None
+    
+    def _check_active_incidents(self, dataset_name: str, config: Dict[str, Any], score: float,
+                                dataset_incidents: List[Dict[str, Any]],
+                                below_threshold: Optional[bool] = None) -> tuple:
+        """Check for active incidents on the dataset"""
+        if dataset_incidents:
+            return {
+                "check": "active_incidents",
+                "status": "failed",
+                "count": len(dataset_incidents),
+                "message": f"{len(dataset_incidents)} active quality incidents"
+            }, f"Resolve {len(dataset_incidents)} active incidents for {dataset_name}"
+        
+        return {
+            "check": "active_incidents",
+            "status": "passed",
+            "count": 0,
+            "message": "No active quality incidents"
+        }, None
+    
     def run_post_deployment_setup(self, datasets: Dict[str, Any]) -> Dict[str, Any]:
         """
         Set up monitoring and alerting after successful deployment
         """
         print("🚀 Setting up post-deployment monitoring...")
         
+        # One timestamp for the whole stage - alert IDs share the deployment time
+        now = datetime.now()
         results = {
             "pipeline_stage": "post_deployment",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "demo_mode": self.demo_mode,
             "monitoring_setup": [],
             "alerts_configured": []
         }
         
-        for dataset_name, config in datasets.items():
-            # Set up quality rules
-            monitoring_result = self._setup_monitoring(dataset_name, config)
+        # Rule creation and alert setup run concurrently across datasets
+        for monitoring_result, alert_result in asyncio.run(self._run_post_deployment(datasets, now)):
             results["monitoring_setup"].append(monitoring_result)
-            
-            # Configure alerts
-            alert_result = self._configure_alerts(dataset_name, config)
             results["alerts_configured"].append(alert_result)
         
         print("✅ Post-deployment monitoring configured")
         return results
     
+    async def _run_post_deployment(self, datasets: Dict[str, Any], now: datetime) -> List[Any]:
+        """Set up monitoring and alerts for every dataset concurrently, keeping dataset order"""
+        semaphore = asyncio.Semaphore(self.parallelism)
+        
+        async def setup(dataset_name: str, config: Dict[str, Any]):
+            # Set up quality rules and configure alerts
+            async with semaphore:
+                return await asyncio.gather(
+                    asyncio.to_thread(self._setup_monitoring, dataset_name, config),
+                    asyncio.to_thread(self._configure_alerts, dataset_name, config, now)
+                )
+        
+        return await asyncio.gather(*(setup(name, config) for name, config in datasets.items()))
+    
     def _setup_monitoring(self, dataset_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Set up quality monitoring for a dataset"""
         result = {
@@ -207,13 +489,15 @@ class DataQualityPipeline:
             # Get appropriate quality rules for this dataset
             rules = self.quality_rules.get_rules_for_table(dataset_name)
             
-            for rule in rules:
-                # Create rule in Monte Carlo (demo or production)
-                rule_config = rule.to_monte_carlo_config()
-                rule_config["table"] = dataset_name
-                
-                mc_rule = self.mc_integration.client.create_quality_rule(rule_config)
-                
+            rule_configs = [rule.to_monte_carlo_config() | {"table": dataset_name} for rule in rules]
+            
+            # Create rules in Monte Carlo (demo or production) - one bulk call when the client supports it
+            if hasattr(self.mc_integration.client, "create_quality_rules_bulk"):
+                mc_rules = self._api_call("create_quality_rules_bulk", rule_configs)
+            else:
+                mc_rules = [self._api_call("create_quality_rule", rule_config) for rule_config in rule_configs]
+            
+            for rule_config, mc_rule in zip(rule_configs, mc_rules):
                 result["rules_created"].append({
                     "rule_id": mc_rule["rule_id"],
                     "type": rule_config["rule_type"],
@@ -228,7 +512,8 @@ class DataQualityPipeline:
         
         return result
     
-    def _configure_alerts(self, dataset_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _configure_alerts(self, dataset_name: str, config: Dict[str, Any],
+                          _now: Optional[datetime] = None) -> Dict[str, Any]:
         """Configure alerting for a dataset"""
         result = {
             "dataset": dataset_name,
@@ -264,8 +549,9 @@ class DataQualityPipeline:
                 })
             
             # Create alerts (simulated in demo mode)
+            ts = (_now or datetime.now()).strftime('%Y%m%d%H%M%S')
             for alert_config in alert_configs:
-                alert_id = f"alert-{dataset_name}-{alert_config['type']}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+                alert_id = f"alert-{dataset_name}-{alert_config['type']}-{ts}"
                 
                 if self.demo_mode:
                     status = "created (demo)"
@@ -291,67 +577,16 @@ class DataQualityPipeline:
         """
         Generate CI/CD pipeline configuration (GitHub Actions, GitLab CI, etc.)
         """
-        config = {
-            "name": "Data Quality Pipeline",
-            "on": {
-                "push": {"branches": ["main", "staging"]},
-                "pull_request": {"branches": ["main"]}
-            },
-            "jobs": {
-                "data_quality_checks": {
-                    "runs-on": "ubuntu-latest",
-                    "steps": [
-                        {
-                            "name": "Checkout code",
-                            "uses": "actions/checkout@v3"
-                        },
-                        {
-                            "name": "Set up Python",
-                            "uses": "actions/setup-python@v4",
-                            "with": {"python-version": "3.12"}
-                        },
-                        {
-                            "name": "Install dependencies",
-                            "run": "pip install -r requirements.txt pycarlo"
-                        },
-                        {
-                            "name": "Run data quality checks",
-                            "run": "python pycarlo_integration/pipeline_integration.py --check-quality",
-                            "env": {
-                                "MONTE_CARLO_API_ID": "${{ secrets.MONTE_CARLO_API_ID }}",
-                                "MONTE_CARLO_API_TOKEN": "${{ secrets.MONTE_CARLO_API_TOKEN }}"
-                            }
-                        }
-                    ]
-                },
-                "deploy": {
-                    "needs": "data_quality_checks",
-                    "runs-on": "ubuntu-latest",
-                    "if": "success()",
-                    "steps": [
-                        {
-                            "name": "Deploy application",
-                            "run": "echo 'Deploying application...'"
-                        },
-                        {
-                            "name": "Setup monitoring",
-                            "run": "python pycarlo_integration/pipeline_integration.py --setup-monitoring"
-                        }
-                    ]
-                }
-            }
-        }
-        
-        return json.dumps(config, indent=2)
+        return _PIPELINE_CONFIG_JSON
 
 
-def main():
+def main(parallelism: int = 8):
     """Main function for testing pipeline integration"""
     print("🚀 CI/CD Pipeline Integration Demo")
     print("=" * 50)
     
     # Initialize pipeline
-    pipeline = DataQualityPipeline(demo_mode=True)
+    pipeline = DataQualityPipeline(demo_mode=True, parallelism=parallelism)
     
     # Define demo datasets
     demo_datasets = {
@@ -373,13 +608,15 @@ def main():
     print("\n🔍 Pre-deployment Quality Checks:")
     pre_results = pipeline.run_pre_deployment_checks(demo_datasets)
     
+    out = []
     for gate in pre_results["quality_gates"]:
         status_emoji = "✅" if gate["passed"] else "❌"
-        print(f"{status_emoji} {gate['dataset']}: {gate['quality_score']:.1f}% quality score")
+        out.append(f"{status_emoji} {gate['dataset']}: {gate['quality_score']:.1f}% quality score")
         
         for check in gate["checks"]:
-            check_emoji = "✅" if check["status"] == "passed" else "❌"
-            print(f"    {check_emoji} {check['message']}")
+            check_emoji = {"passed": "✅", "skipped": "⏭️"}.get(check["status"], "❌")
+            out.append(f"    {check_emoji} {check['message']}")
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Simulate deployment decision
     if pre_results["overall_status"] == "passed":
@@ -389,17 +626,20 @@ def main():
         print(f"\n⚙️ Post-deployment Setup:")
         post_results = pipeline.run_post_deployment_setup(demo_datasets)
         
-        for setup in post_results["monitoring_setup"]:
-            print(f"📊 {setup['dataset']}: {len(setup.get('rules_created', []))} quality rules created")
-        
-        for alerts in post_results["alerts_configured"]:
-            print(f"🚨 {alerts['dataset']}: {len(alerts.get('alerts', []))} alerts configured")
+        out = [
+            f"📊 {setup['dataset']}: {len(setup.get('rules_created', []))} quality rules created"
+            for setup in post_results["monitoring_setup"]
+        ]
+        out.extend(
+            f"🚨 {alerts['dataset']}: {len(alerts.get('alerts', []))} alerts configured"
+            for alerts in post_results["alerts_configured"]
+        )
+        sys.stdout.write("\n".join(out) + "\n")
     
     else:
-        print(f"\n🚨 Quality gates failed! Blocking deployment.")
-        print(f"Recommendations:")
-        for rec in pre_results["recommendations"]:
-            print(f"  💡 {rec}")
+        out = ["\n🚨 Quality gates failed! Blocking deployment.", "Recommendations:"]
+        out.extend(f"  💡 {rec}" for rec in pre_results["recommendations"])
+        sys.stdout.write("\n".join(out) + "\n")
     
     # Generate pipeline configuration
     print(f"\n⚙️ Generated Pipeline Configuration:")
@@ -410,15 +650,19 @@ def main():
 
 
 if __name__ == "__main__":
-    # Check for command line arguments
-    if len(sys.argv) > 1:
-        if "--check-quality" in sys.argv:
-            # This would be called by CI/CD pipeline
-            print("Running quality checks in CI/CD mode...")
-            # Implementation for CI/CD execution
-        elif "--setup-monitoring" in sys.argv:
-            print("Setting up monitoring in CI/CD mode...")
-            # Implementation for monitoring setup
+    parser = argparse.ArgumentParser(description="Monte Carlo data quality pipeline integration")
+    parser.add_argument("--check-quality", action="store_true", help="Run quality checks in CI/CD mode")
+    parser.add_argument("--setup-monitoring", action="store_true", help="Set up monitoring in CI/CD mode")
+    parser.add_argument("--parallelism", type=int, default=8, help="Max datasets processed concurrently")
+    args = parser.parse_args()
+    
+    if args.check_quality:
+        # This would be called by CI/CD pipeline
+        print("Running quality checks in CI/CD mode...")
+        # Implementation for CI/CD execution
+    elif args.setup_monitoring:
+        print("Setting up monitoring in CI/CD mode...")
+        # Implementation for monitoring setup
     else:
         # Run interactive demo
-        main()
+        main(parallelism=args.parallelism)
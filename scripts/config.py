@@ -19,6 +19,7 @@ the basic configuration structure is valid for testing purposes.
 import os
 import sys
 import logging
+import importlib.util
 from pathlib import Path
 
 # Configure logging
@@ -68,12 +69,23 @@ def check_required_files():
         'scripts/load_csv.py'  # Updated path
     ]
     
-    missing_files = []
+    # List each parent directory once instead of stat()-ing every file
+    by_dir = {}
     for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
-        else:
-            logger.info(f"✅ {file_path} exists")
+        by_dir.setdefault(os.path.dirname(file_path) or '.', []).append(file_path)
+    
+    missing_files = []
+    for directory, file_paths in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        for file_path in file_paths:
+            if os.path.basename(file_path) in present:
+                logger.info(f"✅ {file_path} exists")
+            else:
+                missing_files.append(file_path)
     
     if missing_files:
         logger.error(f"❌ Missing required files: {missing_files}")
@@ -83,7 +95,7 @@ def check_required_files():
 
 
 def check_dependencies():
-    """Check that key dependencies can be imported"""
+    """Check that key dependencies are installed (located via find_spec, not imported)"""
     logger.info("Checking Python dependencies...")
     
     dependencies = {
@@ -97,12 +109,12 @@ def check_dependencies():
     
     failed_imports = []
     for module, description in dependencies.items():
-        try:
-            __import__(module)
-            logger.info(f"✅ {module} - {description}")
-        except ImportError as e:
-            logger.error(f"❌ {module} - {description}: {e}")
+        # find_spec only searches sys.path - importing streamlit alone takes seconds
+        if importlib.util.find_spec(module) is None:
+            logger.error(f"❌ {module} - {description}: module not found")
             failed_imports.append(module)
+        else:
+            logger.info(f"✅ {module} - {description}")
     
     if failed_imports:
         logger.error(f"❌ Failed to import: {failed_imports}")
@@ -5,90 +5,112 @@ Creates realistic business data with various quality patterns for demonstration
 Generates datasets that mirror actual enterprise data scenarios.
 """
 
-import csv
+import os
 import random
+import re
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# 1 MiB write buffer - far fewer write() syscalls than the 8 KiB default
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Status prefixes randomly added to titles
+_PREFIXES = ("URGENT:", "UPDATE:", "RESOLVED:", "PENDING:", "CRITICAL:")
+
+# Characters that force a CSV field to be quoted
+_UNSAFE = re.compile(r'[",\n\r]')
+
+
+def _quote(value):
+    """Format one CSV field, quoting only when it holds a delimiter, quote or line break."""
+    if value is None:
+        return ''
+    if _UNSAFE.search(value) is None:
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
 class EnterpriseDatasetGenerator:
-    def __init__(self):
-        # Enterprise business scenarios with quality patterns
-        self.high_quality_scenarios = [
-            ("Quarterly Revenue Report", "Q3 revenue increased by 23% year-over-year, reaching $4.2M with strong performance in enterprise sales and customer retention rates of 94%."),
-            ("Product Launch Success", "New mobile application launched with 50,000+ downloads in first week, achieving 4.7-star rating and 85% user retention after 30 days."),
-            ("Security Audit Complete", "Annual penetration testing completed with no critical vulnerabilities found. All systems updated and security protocols enhanced."),
-            ("Infrastructure Upgrade", "Migration to cloud infrastructure completed successfully with 99.97% uptime maintained and 35% cost reduction achieved."),
-            ("Customer Satisfaction", "NPS score improved to 78 (up from 65), with customers highlighting faster support response times and improved product reliability."),
-            ("Team Performance", "Development team exceeded sprint goals by 15%, delivering all planned features ahead of schedule with zero production bugs."),
-            ("Process Automation", "Automated deployment pipeline reduced release time from 4 hours to 12 minutes while eliminating manual errors."),
-            ("Cost Optimization", "Database query optimization reduced average response time from 1.2s to 180ms, improving user experience significantly."),
-        ]
-        
-        self.quality_violation_scenarios = [
-            ("", "This record has a missing title field which should trigger data quality alerts and validation errors."),
-            ("Data Breach Alert", ""),  # Empty description
-            ("System Failure", None),  # NULL description
-            ("Corrupted Record", "���� encoding issues detected ���� special characters causing display problems ����"),
-            ("Suspicious Activity", "'; DROP TABLE users; SELECT * FROM passwords; --"),
-            ("Short", "Hi"),  # Very short content
-            ("Performance Issue", "Database slow today might need to check"),  # Incomplete/vague
-            ("Critical Error During Migration Process That Exceeded Maximum Title Length Limits", "Title too long - indicates potential data loading issues or schema problems."),
-            ("JSON Error", '{"incomplete": "json object without closing brace"'),
-            ("Repeated Pattern", "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"),
-            ("Special Chars", "Testing with émojis 🚨 and spëcial chäractërs ñoñó"),
-            ("Injection Test", "<script>alert('XSS')</script> DROP DATABASE;"),
-        ]
-        
-        self.business_critical_incidents = [
-            ("API Outage", "Payment processing API experiencing intermittent 500 errors affecting 12% of transactions. Engineering team investigating connection pool exhaustion."),
-            ("Data Quality Alert", "ETL pipeline detected 2,847 records with invalid email formats in customer data. Data validation rules being updated."),
-            ("Security Incident", "Unusual login patterns detected from IP range 185.220.101.x. Account security measures activated and monitoring increased."),
-            ("Performance Degradation", "Application response times increased 340% during peak hours. Database query optimization and load balancing in progress."),
-            ("Compliance Issue", "GDPR audit revealed 15,000 customer records retained beyond policy limits. Automated deletion process initiated."),
-            ("System Capacity", "Database storage approaching 85% capacity. Archival process scheduled and additional storage provisioning requested."),
-            ("Integration Failure", "Third-party payment gateway timeout errors affecting checkout completion. Fallback payment options activated."),
-            ("Monitoring Alert", "CPU utilization exceeded 90% threshold on production servers for 45 minutes. Auto-scaling policies triggered."),
-        ]
+    # Enterprise business scenarios with quality patterns
+    high_quality_scenarios = (
+        ("Quarterly Revenue Report", "Q3 revenue increased by 23% year-over-year, reaching $4.2M with strong performance in enterprise sales and customer retention rates of 94%."),
+        ("Product Launch Success", "New mobile application launched with 50,000+ downloads in first week, achieving 4.7-star rating and 85% user retention after 30 days."),
+        ("Security Audit Complete", "Annual penetration testing completed with no critical vulnerabilities found. All systems updated and security protocols enhanced."),
+        ("Infrastructure Upgrade", "Migration to cloud infrastructure completed successfully with 99.97% uptime maintained and 35% cost reduction achieved."),
+        ("Customer Satisfaction", "NPS score improved to 78 (up from 65), with customers highlighting faster support response times and improved product reliability."),
+        ("Team Performance", "Development team exceeded sprint goals by 15%, delivering all planned features ahead of schedule with zero production bugs."),
+        ("Process Automation", "Automated deployment pipeline reduced release time from 4 hours to 12 minutes while eliminating manual errors."),
+        ("Cost Optimization", "Database query optimization reduced average response time from 1.2s to 180ms, improving user experience significantly."),
+    )
+    
+    quality_violation_scenarios = (
+        ("", "This record has a missing title field which should trigger data quality alerts and validation errors."),
+        ("Data Breach Alert", ""),  # Empty description
+        ("System Failure", None),  # NULL description
+        ("Corrupted Record", "���� encoding issues detected ���� special characters causing display problems ����"),
+        ("Suspicious Activity", "'; DROP TABLE users; SELECT * FROM passwords; --"),
+        ("Short", "Hi"),  # Very short content
+        ("Performance Issue", "Database slow today might need to check"),  # Incomplete/vague
+        ("Critical Error During Migration Process That Exceeded Maximum Title Length Limits", "Title too long - indicates potential data loading issues or schema problems."),
+        ("JSON Error", '{"incomplete": "json object without closing brace"'),
+        ("Repeated Pattern", "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"),
+        ("Special Chars", "Testing with émojis 🚨 and spëcial chäractërs ñoñó"),
+        ("Injection Test", "<script>alert('XSS')</script> DROP DATABASE;"),
+    )
+    
+    business_critical_incidents = (
+        ("API Outage", "Payment processing API experiencing intermittent 500 errors affecting 12% of transactions. Engineering team investigating connection pool exhaustion."),
+        ("Data Quality Alert", "ETL pipeline detected 2,847 records with invalid email formats in customer data. Data validation rules being updated."),
+        ("Security Incident", "Unusual login patterns detected from IP range 185.220.101.x. Account security measures activated and monitoring increased."),
+        ("Performance Degradation", "Application response times increased 340% during peak hours. Database query optimization and load balancing in progress."),
+        ("Compliance Issue", "GDPR audit revealed 15,000 customer records retained beyond policy limits. Automated deletion process initiated."),
+        ("System Capacity", "Database storage approaching 85% capacity. Archival process scheduled and additional storage provisioning requested."),
+        ("Integration Failure", "Third-party payment gateway timeout errors affecting checkout completion. Fallback payment options activated."),
+        ("Monitoring Alert", "CPU utilization exceeded 90% threshold on production servers for 45 minutes. Auto-scaling policies triggered."),
+    )
+    
+    # Sampling pool for "mixed" files, concatenated once
+    _mixed_pool = high_quality_scenarios + quality_violation_scenarios + business_critical_incidents
+    
+    def __init__(self, seed=None):
+        # Dedicated RNG - pass a seed for reproducible datasets
+        self.rng = random.Random(seed)
     
     def generate_csv_file(self, filename, num_records=20, scenario_type="mixed"):
         """Generate a CSV file with fake data."""
         
         records = []
         
+        # Sample records with replacement straight from the scenario tuples
         if scenario_type == "good":
-            scenarios = self.high_quality_scenarios * (num_records // len(self.high_quality_scenarios) + 1)
+            selected_scenarios = self.rng.choices(self.high_quality_scenarios, k=num_records)
         elif scenario_type == "problematic":
-            scenarios = self.quality_violation_scenarios * (num_records // len(self.quality_violation_scenarios) + 1)
+            selected_scenarios = self.rng.choices(self.quality_violation_scenarios, k=num_records)
         elif scenario_type == "realistic":
-            scenarios = self.business_critical_incidents * (num_records // len(self.business_critical_incidents) + 1)
+            selected_scenarios = self.rng.choices(self.business_critical_incidents, k=num_records)
         else:  # mixed
-            scenarios = (self.high_quality_scenarios + self.quality_violation_scenarios + self.business_critical_incidents)
-            random.shuffle(scenarios)
+            selected_scenarios = self.rng.choices(self._mixed_pool, k=num_records)
         
-        # Select records
-        selected_scenarios = scenarios[:num_records]
+        # Draw every record's prefix decision up front - one C-level call per field
+        num_selected = len(selected_scenarios)
+        add_prefix = self.rng.choices((False, True), weights=(0.7, 0.3), k=num_selected)
+        prefix_picks = self.rng.choices(_PREFIXES, k=num_selected)
         
         # Add some variation and timestamps
-        for i, (title, description) in enumerate(selected_scenarios):
+        for (title, description), prefixed, prefix in zip(selected_scenarios, add_prefix, prefix_picks):
             # Add some variation to titles
-            if title and random.random() < 0.3:
-                prefixes = ["URGENT:", "UPDATE:", "RESOLVED:", "PENDING:", "CRITICAL:"]
-                title = f"{random.choice(prefixes)} {title}"
+            if title and prefixed:
+                title = f"{prefix} {title}"
             
-            records.append({
-                'title': title,
-                'description': description
-            })
+            records.append((title, description))
         
         # Write CSV file
         filepath = Path("demo") / filename
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['title', 'description']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for record in records:
-                writer.writerow(record)
+        lines = ['title,description']
+        lines.extend(f'{_quote(title)},{_quote(description)}' for title, description in records)
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as csvfile:
+            csvfile.write('\n'.join(lines) + '\n')
         
         print(f"✅ Created {filepath} with {len(records)} records")
         return filepath
@@ -117,52 +139,64 @@ class EnterpriseDatasetGenerator:
             "Disk space usage increased by 5%",
         ]
         
+        # Bind the RNG methods locally - saves a global + attribute lookup per call
+        randint = self.rng.randint
+        choices = self.rng.choices
+        
         for day in range(days):
             current_date = base_date + datetime.timedelta(days=day)
+            # f-string fields skip strftime's format-string interpreter
+            date_str = f"{current_date.year:04d}-{current_date.month:02d}-{current_date.day:02d}"
+            time_str = f"{current_date.hour:02d}:{current_date.minute:02d}"
             
             # Generate 3-5 events per day
-            num_events = random.randint(3, 5)
+            num_events = randint(3, 5)
+            is_issue = choices((False, True), weights=(0.85, 0.15), k=num_events)  # 15% chance of issues
+            issue_picks = choices(issues, k=num_events)
+            event_picks = choices(daily_events, k=num_events)
             
-            for event in range(num_events):
-                if random.random() < 0.15:  # 15% chance of issues
-                    title = f"Alert - {current_date.strftime('%Y-%m-%d')}"
-                    description = random.choice(issues) + f" detected at {current_date.strftime('%H:%M')}"
+            for issue, issue_text, event_text in zip(is_issue, issue_picks, event_picks):
+                if issue:
+                    title = f"Alert - {date_str}"
+                    description = issue_text + f" detected at {time_str}"
                 else:
-                    title = f"Status - {current_date.strftime('%Y-%m-%d')}"
-                    description = random.choice(daily_events) + f" at {current_date.strftime('%H:%M')}"
+                    title = f"Status - {date_str}"
+                    description = event_text + f" at {time_str}"
                 
-                records.append({
-                    'title': title,
-                    'description': description
-                })
+                records.append((title, description))
         
         # Write CSV file
         filepath = Path("demo") / filename
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['title', 'description']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for record in records:
-                writer.writerow(record)
+        lines = ['title,description']
+        lines.extend(f'{_quote(title)},{_quote(description)}' for title, description in records)
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as csvfile:
+            csvfile.write('\n'.join(lines) + '\n')
         
         print(f"✅ Created {filepath} with {len(records)} time-series records")
         return filepath
 
+def _run_task(task):
+    """Run one generator method in a worker process (the generator is built there, not pickled)."""
+    method_name, args = task
+    return getattr(EnterpriseDatasetGenerator(), method_name)(*args)
+
 def main():
     """Generate various types of enterprise datasets for Monte Carlo platform demonstration."""
     
-    generator = EnterpriseDatasetGenerator()
-    
     print("� Enterprise Dataset Generator for Monte Carlo Platform")
     print("=" * 60)
     
-    # Generate different types of enterprise data
-    generator.generate_csv_file("customer_engagement_metrics_baseline.csv", 15, "good")
-    generator.generate_csv_file("data_quality_violations_detected.csv", 20, "problematic") 
-    generator.generate_csv_file("business_critical_incidents.csv", 12, "realistic")
-    generator.generate_csv_file("mixed_quality_operations_data.csv", 25, "mixed")
-    generator.generate_time_series_data("system_monitoring_events_stream.csv", 5)
+    # Generate different types of enterprise data - each writes its own file,
+    # so they run side by side in a process pool
+    tasks = [
+        ("generate_csv_file", ("customer_engagement_metrics_baseline.csv", 15, "good")),
+        ("generate_csv_file", ("data_quality_violations_detected.csv", 20, "problematic")),
+        ("generate_csv_file", ("business_critical_incidents.csv", 12, "realistic")),
+        ("generate_csv_file", ("mixed_quality_operations_data.csv", 25, "mixed")),
+        ("generate_time_series_data", ("system_monitoring_events_stream.csv", 5)),
+    ]
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as pool:
+        list(pool.map(_run_task, tasks))
     
     print("\n🎯 Enterprise datasets created in demo/ folder!")
     print("📝 Use these datasets for Monte Carlo platform demonstrations:")
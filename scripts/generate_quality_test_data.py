@@ -4,12 +4,27 @@ Generates enterprise-grade test datasets with various quality patterns for platf
 Creates realistic sample data for testing observability features and quality monitoring.
 """
 
+import argparse
+import os
+import numpy as np
 import pandas as pd
 import random
 import string
 from datetime import datetime, timedelta
 import uuid
 
+# pyarrow is optional - C-level CSV writing when available, and required for Parquet output
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 1 MiB write buffer - far fewer write() syscalls than the 8 KiB default
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
 # Enterprise data templates
 BUSINESS_TITLES = [
     "System Performance Alert",
@@ -55,7 +70,7 @@ QUALITY_VIOLATION_DESCRIPTIONS = [
     "Update needed"  # Unclear
 ]
 
-EDGE_CASE_DESCRIPTIONS = [
+EDGE_CASE_DESCRIPTIONS = (
     "This description contains special characters: àáâãäåæçèéêë ñòóôõö ùúûüý €£¥ @#$%^&*()",
     "Description with\nnewlines\nand\ttabs\tfor testing",
     "Very long description " + "that keeps going " * 50 + "and never seems to end.",
@@ -66,53 +81,49 @@ EDGE_CASE_DESCRIPTIONS = [
     "SQL injection attempt: '; DROP TABLE users; --",
     "HTML tags: <script>alert('test')</script> <b>bold</b> <i>italic</i>",
     "Unicode test: 测试 тест テスト اختبار परीक्षा"
-]
+)
+
+def _pick(rng, options, size):
+    """Draw size values uniformly from options as an object array."""
+    return np.asarray(options, dtype=object)[rng.integers(0, len(options), size)]
 
 def generate_enterprise_operational_data(num_records=100, include_quality_issues=True):
     """Generate sample data with various quality characteristics."""
     
-    data = []
+    rng = np.random.default_rng()
+    n = num_records
     start_id = 2000  # Start from 2000 to avoid conflicts
     
-    for i in range(num_records):
-        record_id = start_id + i
-        
-        # Choose title
-        if random.random() < 0.05 and include_quality_issues:  # 5% chance of problematic title
-            title = random.choice(["", "TBD", "Update", "Fix"])
-        else:
-            title = random.choice(BUSINESS_TITLES)
-            
-        # Add variation to titles
-        if random.random() < 0.3:
-            title += f" - {random.choice(['Q1', 'Q2', 'Q3', 'Q4', '2025', 'v2.1', 'Phase 1'])}"
-        
-        # Choose description based on probability
-        description_type = random.choices(
-            ['good', 'problematic', 'edge_case', 'null'],
-            weights=[70, 15, 10, 5],  # 70% good, 15% problematic, 10% edge cases, 5% null
-            k=1
-        )[0]
-        
-        if description_type == 'good':
-            description = random.choice(HIGH_QUALITY_DESCRIPTIONS)
-            # Add some variation
-            if random.random() < 0.3:
-                description += f" Ticket ID: {random.randint(1000, 9999)}"
-        elif description_type == 'problematic':
-            description = random.choice(QUALITY_VIOLATION_DESCRIPTIONS)
-        elif description_type == 'edge_case':
-            description = random.choice(EDGE_CASE_DESCRIPTIONS)
-        else:  # null
-            description = None
-            
-        data.append({
-            'id': record_id,
-            'title': title,
-            'description': description
-        })
-    
-    return pd.DataFrame(data)
+    # Choose titles - 5% problematic when quality issues are requested
+    titles = _pick(rng, BUSINESS_TITLES, n)
+    if include_quality_issues:
+        bad_title = rng.random(n) < 0.05
+        titles[bad_title] = _pick(rng, ["", "TBD", "Update", "Fix"], int(bad_title.sum()))
+    
+    # Add variation to titles
+    suffixed = rng.random(n) < 0.3
+    titles[suffixed] = titles[suffixed] + " - " + _pick(
+        rng, ['Q1', 'Q2', 'Q3', 'Q4', '2025', 'v2.1', 'Phase 1'], int(suffixed.sum())
+    )
+    
+    # Description type: 70% good, 15% problematic, 10% edge cases, 5% null
+    description_type = rng.choice(4, size=n, p=[0.70, 0.15, 0.10, 0.05])
+    descriptions = np.full(n, None, dtype=object)
+    templates_by_type = (HIGH_QUALITY_DESCRIPTIONS, QUALITY_VIOLATION_DESCRIPTIONS, EDGE_CASE_DESCRIPTIONS)
+    for type_code, templates in enumerate(templates_by_type):
+        mask = description_type == type_code
+        descriptions[mask] = _pick(rng, templates, int(mask.sum()))
+    
+    # Add some variation to good descriptions
+    ticketed = (description_type == 0) & (rng.random(n) < 0.3)
+    ticket_ids = rng.integers(1000, 10000, int(ticketed.sum())).astype(str).astype(object)
+    descriptions[ticketed] = descriptions[ticketed] + " Ticket ID: " + ticket_ids
+    
+    return pd.DataFrame({
+        'id': np.arange(start_id, start_id + n),
+        'title': titles,
+        'description': descriptions
+    })
 
 def generate_system_monitoring_events(num_records=50):
     """Generate data with timestamps to simulate real-time data flow."""
@@ -120,66 +131,94 @@ def generate_system_monitoring_events(num_records=50):
     data = []
     start_date = datetime.now() - timedelta(days=30)
     
-    for i in range(num_records):
-        # Generate timestamp
-        timestamp = start_date + timedelta(
-            days=random.randint(0, 30),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59)
-        )
-        
-        # Simulate different event types
-        event_types = ['alert', 'info', 'warning', 'error', 'success']
-        event_type = random.choice(event_types)
-        
-        # Generate severity based on event type
-        severity_map = {
-            'error': random.choice(['high', 'critical']),
-            'warning': random.choice(['medium', 'high']),
-            'alert': random.choice(['medium', 'high', 'critical']),
-            'info': 'low',
-            'success': 'low'
-        }
+    # Simulate different event types
+    event_types = ('alert', 'info', 'warning', 'error', 'success')
+    source_systems = ('api', 'database', 'frontend', 'mobile', 'etl')
+    
+    # Severity options by event type
+    severity_options = {
+        'error': ('high', 'critical'),
+        'warning': ('medium', 'high'),
+        'alert': ('medium', 'high', 'critical'),
+        'info': ('low',),
+        'success': ('low',)
+    }
+    
+    # Generate all timestamps in one vectorized pass: a random day, hour and minute offset per event
+    rng = np.random.default_rng()
+    offset_minutes = (
+        rng.integers(0, 31, num_records) * 24 * 60
+        + rng.integers(0, 24, num_records) * 60
+        + rng.integers(0, 60, num_records)
+    )
+    timestamps = pd.Timestamp(start_date) + pd.to_timedelta(offset_minutes, unit='m')
+    generated_at = timestamps.strftime('%Y-%m-%d %H:%M:%S')
+    iso_timestamps = timestamps.strftime('%Y-%m-%dT%H:%M:%S.%f')
+    
+    # Bind the RNG method locally - saves a global + attribute lookup per call
+    choice = random.choice
+    
+    for i, (generated, iso_timestamp) in enumerate(zip(generated_at, iso_timestamps)):
+        event_type = choice(event_types)
         
-        data.append({
-            'id': 3000 + i,
-            'title': f"{event_type.title()} Event {i+1}",
-            'description': f"Automated {event_type} generated at {timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-            'event_type': event_type,
-            'severity': severity_map[event_type],
-            'timestamp': timestamp.isoformat(),
-            'source_system': random.choice(['api', 'database', 'frontend', 'mobile', 'etl'])
-        })
-    
-    return pd.DataFrame(data)
+        data.append((
+            3000 + i,
+            f"{event_type.title()} Event {i+1}",
+            f"Automated {event_type} generated at {generated}",
+            event_type,
+            choice(severity_options[event_type]),
+            iso_timestamp,
+            choice(source_systems)
+        ))
+    
+    return pd.DataFrame.from_records(
+        data, columns=['id', 'title', 'description', 'event_type', 'severity', 'timestamp', 'source_system']
+    )
+
+def write_dataset(df, path, output_format="csv"):
+    """
+    Write a generated DataFrame to CSV (via pyarrow when installed) or to
+    zstd-compressed Parquet, swapping the path's extension to match. Returns the path written.
+    """
+    if output_format == "parquet":
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("Parquet output requires pyarrow")
+        path = os.path.splitext(path)[0] + ".parquet"
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, compression='zstd')
+        return path
+    if PYARROW_AVAILABLE:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(batch_size=8192))
+        return path
+    with open(path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+        df.to_csv(f, index=False)
+    return path
 
-def main():
+def main(output_format="csv"):
     """Generate enterprise quality test datasets for Monte Carlo platform validation."""
     
     print("� Generating Enterprise Quality Test Data for Monte Carlo Platform...")
     
     # Generate baseline operational data
     operational_df = generate_enterprise_operational_data(100, include_quality_issues=True)
-    operational_df.to_csv("data/user_behavior_analytics_2025.csv", index=False)
-    print(f"✅ Generated user_behavior_analytics_2025.csv with {len(operational_df)} records")
+    path = write_dataset(operational_df, "data/user_behavior_analytics_2025.csv", output_format)
+    print(f"✅ Generated {os.path.basename(path)} with {len(operational_df)} records")
     
     # Generate system monitoring events
     monitoring_df = generate_system_monitoring_events(50)
-    monitoring_df.to_csv("data/system_monitoring_events_2025.csv", index=False)
-    print(f"✅ Generated system_monitoring_events_2025.csv with {len(monitoring_df)} records")
-    
-    # Generate quality violation dataset
-    quality_violations = []
-    for i in range(20):
-        quality_violations.append({
-            'id': 4000 + i,
-            'title': random.choice(["", "TBD", "Fix", "Update", "NULL", "n/a"]) if i < 10 else f"Valid Title {i}",
-            'description': random.choice(QUALITY_VIOLATION_DESCRIPTIONS + [None, "", " "]) if i < 15 else f"Valid description {i}"
-        })
-    
-    violations_df = pd.DataFrame(quality_violations)
-    violations_df.to_csv("data/data_quality_violations_2025.csv", index=False)
-    print(f"✅ Generated data_quality_violations_2025.csv with {len(violations_df)} records")
+    path = write_dataset(monitoring_df, "data/system_monitoring_events_2025.csv", output_format)
+    print(f"✅ Generated {os.path.basename(path)} with {len(monitoring_df)} records")
+    
+    # Generate quality violation dataset - first 10 titles and first 15 descriptions are bad
+    rng = np.random.default_rng()
+    titles = np.array([f"Valid Title {i}" for i in range(20)], dtype=object)
+    titles[:10] = _pick(rng, ["", "TBD", "Fix", "Update", "NULL", "n/a"], 10)
+    descriptions = np.array([f"Valid description {i}" for i in range(20)], dtype=object)
+    descriptions[:15] = _pick(rng, QUALITY_VIOLATION_DESCRIPTIONS + [None, "", " "], 15)
+    
+    violations_df = pd.DataFrame({'id': np.arange(4000, 4020), 'title': titles, 'description': descriptions})
+    path = write_dataset(violations_df, "data/data_quality_violations_2025.csv", output_format)
+    print(f"✅ Generated {os.path.basename(path)} with {len(violations_df)} records")
     
     # Show enterprise summary
     print(f"\n📊 Enterprise Dataset Generation Summary:")
@@ -194,4 +233,7 @@ def main():
     print(f"   - End-to-end pipeline monitoring with time-series data")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate quality test datasets for the Monte Carlo demo")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv", help="Output file format")
+    args = parser.parse_args()
+    main(output_format=args.format)
@@ -15,7 +15,7 @@ Usage:
     
 Environment:
     - Creates monte_carlo_dbt/database/monte-carlo.duckdb (or connects to existing)
-    - Loads all CSV files from data/ and sample_data/ directories
+    - Loads all CSV and Parquet files from data/ and sample_data/ directories
     - Creates unified 'raw_data' table for dbt models
 """
 
@@ -26,6 +26,13 @@ from pathlib import Path
 from typing import List, Dict, Any
 import logging
 
+# pyarrow is optional - lets DuckDB consume dataframes as Arrow buffers when available
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -35,6 +42,12 @@ PROJECT_ROOT = Path(__file__).parent.parent
 os.chdir(PROJECT_ROOT)
 
 
+def _sql_list(paths: List[Path]) -> str:
+    """Render file paths as a DuckDB list literal"""
+    quoted = ["'" + path.as_posix().replace("'", "''") + "'" for path in paths]
+    return "[" + ", ".join(quoted) + "]"
+
+
 class CSVLoader:
     """Loads CSV files into DuckDB for dbt testing"""
     
@@ -45,74 +58,105 @@ class CSVLoader:
         logger.info(f"Connected to DuckDB at {db_path}")
     
     def get_csv_files(self) -> List[Path]:
-        """Find all CSV files in data/ and sample_data/ directories"""
+        """Find all CSV and Parquet files in data/ and sample_data/ directories"""
         csv_files = []
         
         # Check data/ directory
         data_dir = Path("data")
         if data_dir.exists():
-            csv_files.extend(data_dir.glob("*.csv"))
-            logger.info(f"Found {len(list(data_dir.glob('*.csv')))} CSV files in data/")
+            data_csvs = list(data_dir.glob("*.csv"))
+            csv_files.extend(data_csvs)
+            logger.info(f"Found {len(data_csvs)} CSV files in data/")
+            data_parquets = list(data_dir.glob("*.parquet"))
+            csv_files.extend(data_parquets)
+            logger.info(f"Found {len(data_parquets)} Parquet files in data/")
         
         # Check sample_data/ directory
         sample_data_dir = Path("sample_data")
         if sample_data_dir.exists():
-            csv_files.extend(sample_data_dir.glob("*.csv"))
-            logger.info(f"Found {len(list(sample_data_dir.glob('*.csv')))} CSV files in sample_data/")
+            sample_csvs = list(sample_data_dir.glob("*.csv"))
+            csv_files.extend(sample_csvs)
+            logger.info(f"Found {len(sample_csvs)} CSV files in sample_data/")
+            sample_parquets = list(sample_data_dir.glob("*.parquet"))
+            csv_files.extend(sample_parquets)
+            logger.info(f"Found {len(sample_parquets)} Parquet files in sample_data/")
         
         return csv_files
     
-    def load_csv_file(self, file_path: Path) -> pd.DataFrame:
-        """Load a single CSV file and standardize its structure"""
+    def create_raw_data_table_from_files(self, files: List[Path]) -> None:
+        """
+        Create the raw_data table straight from the source files with DuckDB's
+        parallel CSV/Parquet readers - no pandas round-trip. Files are unioned by
+        column name; missing required columns are added as empty columns. If the
+        combined scan fails, each file is checked on its own and bad files are skipped.
+        """
         try:
-            df = pd.read_csv(file_path)
-            logger.info(f"Loaded {file_path.name}: {len(df)} rows, {len(df.columns)} columns")
-            
-            # Ensure required columns exist
-            required_columns = ['id', 'title', 'description']
-            for col in required_columns:
-                if col not in df.columns:
-                    logger.warning(f"Missing '{col}' column in {file_path.name}, adding empty column")
-                    df[col] = None
-            
-            # Add metadata columns
-            df['source_file'] = file_path.name
-            df['loaded_at'] = pd.Timestamp.now()
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"Error loading {file_path}: {e}")
-            return pd.DataFrame()
-    
-    def combine_dataframes(self, dataframes: List[pd.DataFrame]) -> pd.DataFrame:
-        """Combine multiple dataframes into one standardized dataset"""
-        if not dataframes:
-            logger.warning("No dataframes to combine")
-            return pd.DataFrame()
-        
-        # Filter out empty dataframes
-        valid_dataframes = [df for df in dataframes if not df.empty]
-        
-        if not valid_dataframes:
-            logger.warning("All dataframes are empty")
-            return pd.DataFrame()
+            self._create_raw_data_from(files)
+            return
+        except duckdb.Error as e:
+            if len(files) == 1:
+                logger.error(f"Error loading {files[0]}: {e}")
+                logger.error("Cannot create table: no source file could be loaded")
+                return
+            logger.warning("Combined load failed, checking files one by one")
         
-        # Combine all dataframes
-        combined_df = pd.concat(valid_dataframes, ignore_index=True, sort=False)
+        loadable = []
+        for path in files:
+            try:
+                self.conn.execute(f"SELECT COUNT(*) FROM ({self._source_sql([path])})").fetchone()
+                loadable.append(path)
+            except duckdb.Error as e:
+                logger.error(f"Error loading {path}: {e}")
         
-        # Ensure consistent data types
-        if 'id' in combined_df.columns:
-            combined_df['id'] = combined_df['id'].astype(str)
+        if not loadable:
+            logger.error("Cannot create table: no source file could be loaded")
+            return
         
-        if 'title' in combined_df.columns:
-            combined_df['title'] = combined_df['title'].fillna('').astype(str)
+        try:
+            self._create_raw_data_from(loadable)
+        except Exception as e:
+            logger.error(f"Error creating raw_data table: {e}")
+            raise
+    
+    def _source_sql(self, files: List[Path]) -> str:
+        """Union of the files' rows by column name, with a filename column"""
+        csv_paths = [path for path in files if path.suffix == ".csv"]
+        parquet_paths = [path for path in files if path.suffix == ".parquet"]
         
-        if 'description' in combined_df.columns:
-            combined_df['description'] = combined_df['description'].fillna('').astype(str)
+        sources = []
+        if csv_paths:
+            # all_varchar keeps per-file type sniffing from clashing across files;
+            # null_padding accepts the short rows some sample files contain
+            sources.append(
+                f"SELECT * FROM read_csv_auto({_sql_list(csv_paths)}, filename=true, "
+                f"union_by_name=true, null_padding=true, all_varchar=true)"
+            )
+        if parquet_paths:
+            sources.append(f"SELECT * FROM read_parquet({_sql_list(parquet_paths)}, filename=true, union_by_name=true)")
+        return " UNION ALL BY NAME ".join(sources)
+    
+    def _create_raw_data_from(self, files: List[Path]) -> None:
+        """Build raw_data from the given files in a single scan"""
+        source = self._source_sql(files)
+        present = {row[0] for row in self.conn.execute(f"DESCRIBE {source}").fetchall()}
+        missing = [col for col in ('id', 'title', 'description') if col not in present]
+        for col in missing:
+            logger.warning(f"Missing '{col}' column in all source files, adding empty column")
+        padded = "".join(f", NULL::VARCHAR AS {col}" for col in missing)
         
-        logger.info(f"Combined dataset: {len(combined_df)} total rows")
-        return combined_df
+        self.conn.execute("DROP TABLE IF EXISTS raw_data")
+        self.conn.execute(f"""
+            CREATE TABLE raw_data AS
+            SELECT
+                CAST(id AS VARCHAR) AS id,
+                COALESCE(CAST(title AS VARCHAR), '') AS title,
+                COALESCE(CAST(description AS VARCHAR), '') AS description,
+                * EXCLUDE (id, title, description, filename),
+                parse_filename(filename) AS source_file,
+                current_localtimestamp() AS loaded_at
+            FROM (SELECT *{padded} FROM ({source}))
+        """)
+        self._log_raw_data_summary()
     
     def create_raw_data_table(self, df: pd.DataFrame) -> None:
         """Create the raw_data table in DuckDB"""
@@ -125,22 +169,28 @@ class CSVLoader:
             self.conn.execute("DROP TABLE IF EXISTS raw_data")
             
             # Create table from dataframe
-            self.conn.register('temp_df', df)
-            self.conn.execute("CREATE TABLE raw_data AS SELECT * FROM temp_df")
-            
-            # Verify table creation
-            row_count = self.conn.execute("SELECT COUNT(*) FROM raw_data").fetchone()[0]
-            logger.info(f"Created raw_data table with {row_count} rows")
-            
-            # Show sample of the data
-            sample = self.conn.execute("SELECT id, title, LEFT(description, 50) as description_preview FROM raw_data LIMIT 5").fetchdf()
-            logger.info("Sample data:")
-            logger.info(f"\n{sample.to_string(index=False)}")
+            if PYARROW_AVAILABLE:
+                # Hand DuckDB Arrow buffers instead of walking pandas object arrays
+                self.conn.from_arrow(pa.Table.from_pandas(df, preserve_index=False)).create('raw_data')
+            else:
+                self.conn.register('temp_df', df)
+                self.conn.execute("CREATE TABLE raw_data AS SELECT * FROM temp_df")
+            self._log_raw_data_summary()
             
         except Exception as e:
             logger.error(f"Error creating raw_data table: {e}")
             raise
     
+    def _log_raw_data_summary(self) -> None:
+        """Log the raw_data row count and a preview of its first rows"""
+        row_count = self.conn.execute("SELECT COUNT(*) FROM raw_data").fetchone()[0]
+        logger.info(f"Created raw_data table with {row_count} rows")
+        
+        # Show sample of the data
+        rows = self.conn.execute("SELECT id, title, LEFT(description, 50) as description_preview FROM raw_data LIMIT 5").fetchall()
+        logger.info("Sample data:")
+        logger.info("\n" + "\n".join(" | ".join(map(str, row)) for row in rows))
+    
     def validate_data(self) -> bool:
         """Validate the loaded data meets dbt model requirements"""
         try:
@@ -211,16 +261,8 @@ def main():
             logger.info("Created minimal test dataset")
             loader.create_raw_data_table(test_data)
         else:
-            # Load all CSV files
-            dataframes = []
-            for csv_file in csv_files:
-                df = loader.load_csv_file(csv_file)
-                if not df.empty:
-                    dataframes.append(df)
-            
-            # Combine and load data
-            combined_df = loader.combine_dataframes(dataframes)
-            loader.create_raw_data_table(combined_df)
+            # Load every file in one DuckDB scan
+            loader.create_raw_data_table_from_files(csv_files)
         
         # Validate the loaded data
         if loader.validate_data():
@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures for the monte-carlo-demo tests.
+"""
+
+import duckdb
+import pytest
+
+
+@pytest.fixture
+def duck():
+    """In-memory DuckDB connection - no database file, WAL or cleanup per test."""
+    con = duckdb.connect(":memory:")
+    yield con
+    con.close()
+
+
+@pytest.fixture(scope="session")
+def mc_client():
+    """Demo Monte Carlo client built once per session (per worker under xdist)."""
+    from monte_carlo_client import MonteCarloIntegration
+    return MonteCarloIntegration(demo_mode=True).client
@@ -1,14 +1,14 @@
 """
 Unit tests for the monte-carlo-demo project.
 Run with: python -m pytest tests/
+Run in parallel with pytest-xdist: python -m pytest tests/ -n auto --dist loadfile
+(loadfile keeps each module on one worker so session fixtures are built once)
 """
 
+import io
 import pytest
 import pandas as pd
-import duckdb
 from pathlib import Path
-import tempfile
-import os
 
 
 class TestLoadCSV:
@@ -16,53 +16,82 @@ class TestLoadCSV:
     
     def test_csv_loading(self):
         """Test that CSV data can be loaded correctly."""
-        # Create temporary CSV
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("id,title,description\n")
-            f.write("1,Test,This is a test description\n")
-            csv_path = f.name
+        # Parse the CSV from memory - same parser path, no temp file
+        csv_text = io.StringIO("id,title,description\n1,Test,This is a test description\n")
         
-        try:
-            # Load CSV
-            df = pd.read_csv(csv_path)
-            
-            # Assertions
-            assert len(df) == 1
-            assert df.iloc[0]['id'] == 1
-            assert df.iloc[0]['title'] == 'Test'
-            assert 'description' in df.columns
-            
-        finally:
-            os.unlink(csv_path)
+        # Load CSV
+        df = pd.read_csv(csv_text)
+        
+        # Assertions
+        assert len(df) == 1
+        assert df.iloc[0]['id'] == 1
+        assert df.iloc[0]['title'] == 'Test'
+        assert 'description' in df.columns
 
 
 class TestDuckDBOperations:
     """Test DuckDB database operations."""
     
-    def test_duckdb_connection(self):
+    def test_duckdb_connection(self, duck):
         """Test DuckDB connection and basic operations."""
-        with tempfile.NamedTemporaryFile(suffix='.duckdb', delete=True) as f:
-            db_path = f.name
+        # Create test table
+        duck.execute("CREATE TABLE test_table (id INTEGER, name VARCHAR)")
+        duck.execute("INSERT INTO test_table VALUES (1, 'test')")
+        
+        # Query data
+        result = duck.execute("SELECT * FROM test_table").fetchall()
+        
+        # Assertions
+        assert len(result) == 1
+        assert result[0][0] == 1
+        assert result[0][1] == 'test'
+
+
+class TestMonteCarloClient:
+    """Test the demo Monte Carlo client."""
+    
+    def test_mc_connection(self, mc_client):
+        """Test that the demo client reports a connection."""
+        status = mc_client.test_connection()
+        assert status['status'] == 'connected'
+        assert status['mode'] == 'demo'
+    
+    def test_mc_account_info(self, mc_client):
+        """Test demo account information."""
+        account_info = mc_client.get_account_info()
+        assert account_info['mode'] == 'demo'
+        assert account_info['account_id']
+    
+    def test_mc_quality_metrics(self, mc_client):
+        """Test overall and per-table quality metrics."""
+        metrics = mc_client.get_quality_metrics()
+        assert metrics['tables_monitored'] > 0
         
-        try:
-            # Connect and create test table
-            con = duckdb.connect(db_path)
-            con.execute("CREATE TABLE test_table (id INTEGER, name VARCHAR)")
-            con.execute("INSERT INTO test_table VALUES (1, 'test')")
-            
-            # Query data
-            result = con.execute("SELECT * FROM test_table").fetchall()
-            
-            # Assertions
-            assert len(result) == 1
-            assert result[0][0] == 1
-            assert result[0][1] == 'test'
-            
-            con.close()
-            
-        finally:
-            if os.path.exists(db_path):
-                os.unlink(db_path)
+        table_metrics = mc_client.get_quality_metrics("product_operations_incidents_2025")
+        assert 0 <= table_metrics['quality_score'] <= 100
+
+
+class TestValidityRule:
+    """Test allowed-value checks in the validity rule."""
+    
+    @staticmethod
+    def _valid_count(allowed, data):
+        from quality_rules import ValidityRule
+        rule = ValidityRule(name="Allowed", description="Allowed values", column="c", constraints={"values": allowed})
+        return rule.validate(pd.DataFrame({"c": data}))["details"][0]["valid_count"]
+    
+    def test_mixed_type_allowed_values(self):
+        """Mixed int/str allowed values still match ints and strings."""
+        assert self._valid_count([1, "a"], [1, 2, 3]) == 1
+        assert self._valid_count([1, "a"], ["a", "b", 1]) == 2
+    
+    def test_int_allowed_values_on_float_column(self):
+        """Integer allowed values match equal floats."""
+        assert self._valid_count([1, 2], [1.0, 2.0, 3.5]) == 2
+    
+    def test_bool_allowed_values(self):
+        """Boolean allowed values match booleans."""
+        assert self._valid_count([True], [True, False, True]) == 2
 
 
 class TestConfiguration:
@@ -70,8 +99,10 @@ class TestConfiguration:
     
     def test_config_validation(self):
         """Test configuration validation logic."""
-        import sys
-        sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+        # The dashboard module needs its UI/AI stack; skip cleanly where it isn't installed
+        for module in ("streamlit", "openai", "watchdog", "dotenv"):
+            pytest.importorskip(module)
+        
         from monte_carlo_dashboard import Config
         
         # Test with missing environment variables